@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import logging
 import random
 import warnings
@@ -96,6 +97,8 @@ class Agent(ControlFlowModel, abc.ABC):
     )
 
     _cm_stack: list[AbstractContextManager] = PrivateAttr(default_factory=list)
+    _prompt_cache: Optional[tuple] = PrivateAttr(default=None)
+    _llm_rules_cache: Optional[tuple] = PrivateAttr(default=None)
 
     def __init__(self, instructions: Optional[str] = None, **kwargs):
         if instructions is not None:
@@ -183,12 +186,25 @@ class Agent(ControlFlowModel, abc.ABC):
         """
         Retrieve the LLM rules for this agent's model
         """
-        if self.llm_rules is None:
-            return controlflow.llm.rules.rules_for_model(self.get_model())
-        else:
+        if self.llm_rules is not None:
             return self.llm_rules
 
+        # rules are inferred from the model, so cache them against the resolved
+        # model object rather than re-deriving them on every LLM call
+        model = self.get_model()
+        if self._llm_rules_cache is None or self._llm_rules_cache[0] is not model:
+            self._llm_rules_cache = (
+                model,
+                controlflow.llm.rules.rules_for_model(model),
+            )
+        return self._llm_rules_cache[1]
+
     def get_tools(self) -> list["Tool"]:
+        # fast path: nothing to add, so skip re-validating with as_tools. The
+        # copy keeps callers from mutating the agent's own tool list.
+        if not self.interactive and not self.memories:
+            return list(self.tools)
+
         from controlflow.tools.input import cli_input
 
         tools = self.tools.copy()
@@ -202,6 +218,19 @@ class Agent(ControlFlowModel, abc.ABC):
     def get_prompt(self) -> str:
         from controlflow.orchestration import prompt_templates
 
+        # the default template depends only on the agent's name, description,
+        # and instructions, so the rendered prompt can be cached against those
+        # fields instead of re-rendered on every orchestrator loop. Custom
+        # prompts may reference arbitrary agent state and are never cached.
+        if self.prompt is None:
+            cache_key = (self.name, self.description, self.instructions)
+            if self._prompt_cache is None or self._prompt_cache[0] != cache_key:
+                template = prompt_templates.AgentTemplate(
+                    template=self.prompt, agent=self
+                )
+                self._prompt_cache = (cache_key, template.render())
+            return self._prompt_cache[1]
+
         template = prompt_templates.AgentTemplate(template=self.prompt, agent=self)
         return template.render()
 
@@ -378,8 +407,11 @@ class Agent(ControlFlowModel, abc.ABC):
 
         yield AgentMessage(agent=self, message=response)
 
-        create_markdown_artifact(
-            markdown=f"""
+        def _create_response_artifact():
+            # serializing the full response and creating the artifact with a
+            # sync client both block, so run them in a thread off the event loop
+            create_markdown_artifact(
+                markdown=f"""
 {response.content or '(No content)'}
 
 #### Payload
@@ -387,9 +419,11 @@ class Agent(ControlFlowModel, abc.ABC):
 {response.model_dump_json(indent=2)}
 ```
 """,
-            description=f"LLM Response for Agent {self.name}",
-            key="agent-message",
-        )
+                description=f"LLM Response for Agent {self.name}",
+                key="agent-message",
+            )
+
+        await asyncio.to_thread(_create_response_artifact)
 
         if controlflow.settings.log_all_messages:
             logger.debug(f"Response: {response}")
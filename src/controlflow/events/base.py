@@ -34,5 +34,9 @@ class Event(ControlFlowModel):
 
 
 class UnpersistedEvent(Event):
-    model_config: ConfigDict = ConfigDict(arbitrary_types_allowed=True)
+    # frozen blocks attribute assignment and skips assignment validation,
+    # which keeps these high-volume events cheap on the emission path. Note
+    # that in-place mutation of container fields (e.g. appending to a list)
+    # still works and is relied on by the message compiler.
+    model_config: ConfigDict = ConfigDict(arbitrary_types_allowed=True, frozen=True)
     persist: bool = False
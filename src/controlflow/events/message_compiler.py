@@ -171,10 +171,12 @@ def trim_messages(
     budget = max_tokens
 
     for message in reversed(messages):
-        if count_tokens(message) > budget:
+        # counting tokens serializes the entire message, so only do it once
+        tokens = count_tokens(message)
+        if tokens > budget:
             break
         new_messages.append(message)
-        budget -= count_tokens(message)
+        budget -= tokens
 
     return list(reversed(new_messages))
 
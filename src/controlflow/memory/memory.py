@@ -2,7 +2,7 @@ import abc
 import re
 from typing import Dict, List, Optional, Union
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 import controlflow
 from controlflow.tools.tools import Tool
@@ -52,6 +52,7 @@ class Memory(ControlFlowModel):
         default_factory=lambda: controlflow.defaults.memory_provider,
         validate_default=True,
     )
+    _tools: Optional[List[Tool]] = PrivateAttr(default=None)
 
     def __hash__(self) -> int:
         return id(self)
@@ -111,6 +112,13 @@ class Memory(ControlFlowModel):
         return self.provider.search(self.key, query, n)
 
     def get_tools(self) -> List[Tool]:
+        # building a Tool generates a JSON schema for each function, which is
+        # expensive enough to cache since the key can't change after creation
+        if self._tools is None:
+            self._tools = self._build_tools()
+        return self._tools
+
+    def _build_tools(self) -> List[Tool]:
         return [
             Tool.from_function(
                 self.add,
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Callable, Optional, TypeVar, Union
 
@@ -102,11 +103,16 @@ class Orchestrator(ControlFlowModel):
         """
         if not isinstance(event, AgentMessageDelta):
             logger.debug(f"Handling event asynchronously: {repr(event)}")
+        # run sync handlers inline and dispatch async handlers concurrently,
+        # so one slow handler doesn't serialize the others
+        coros = []
         for handler in self.handlers:
             if isinstance(handler, AsyncHandler):
-                await handler.handle(event)
+                coros.append(handler.handle(event))
             elif isinstance(handler, Handler):
                 handler.handle(event)
+        if coros:
+            await asyncio.gather(*coros)
         if event.persist:
             self.flow.add_events([event])
 
@@ -153,12 +159,15 @@ class Orchestrator(ControlFlowModel):
         tools = as_tools(tools)
         return tools
 
-    def get_memories(self) -> list[Memory]:
+    def get_memories(self, tasks: Optional[list[Task]] = None) -> list[Memory]:
+        if tasks is None:
+            tasks = self.get_tasks("assigned")
+
         memories = set()
 
         memories.update(self.agent.memories)
 
-        for task in self.get_tasks("assigned"):
+        for task in tasks:
             memories.update(task.memories)
 
         return memories
@@ -173,7 +182,15 @@ class Orchestrator(ControlFlowModel):
             Union[RunEndCondition, Callable[[RunContext], bool]]
         ] = None,
     ) -> RunContext:
-        import controlflow.events.orchestrator_events
+        # deferred import to avoid a circular dependency; bind the event
+        # classes once so the loop doesn't repeat the attribute lookups
+        from controlflow.events.orchestrator_events import (
+            AgentTurnEnd,
+            AgentTurnStart,
+            OrchestratorEnd,
+            OrchestratorError,
+            OrchestratorStart,
+        )
 
         # Create the base termination condition
         if run_until is None:
@@ -200,29 +217,19 @@ class Orchestrator(ControlFlowModel):
             )
 
         # Signal the start of orchestration
-        self.handle_event(
-            controlflow.events.orchestrator_events.OrchestratorStart(orchestrator=self)
-        )
+        self.handle_event(OrchestratorStart(orchestrator=self))
 
         try:
             while True:
                 if run_context.should_end():
                     break
 
-                self.handle_event(
-                    controlflow.events.orchestrator_events.AgentTurnStart(
-                        orchestrator=self, agent=self.agent
-                    )
-                )
+                self.handle_event(AgentTurnStart(orchestrator=self, agent=self.agent))
                 self.run_agent_turn(
                     run_context=run_context,
                     model_kwargs=model_kwargs,
                 )
-                self.handle_event(
-                    controlflow.events.orchestrator_events.AgentTurnEnd(
-                        orchestrator=self, agent=self.agent
-                    )
-                )
+                self.handle_event(AgentTurnEnd(orchestrator=self, agent=self.agent))
 
                 # Select the next agent for the following turn
                 if available_agents := self.get_available_agents():
@@ -232,19 +239,11 @@ class Orchestrator(ControlFlowModel):
 
         except Exception as exc:
             # Handle any exceptions that occur during orchestration
-            self.handle_event(
-                controlflow.events.orchestrator_events.OrchestratorError(
-                    orchestrator=self, error=exc
-                )
-            )
+            self.handle_event(OrchestratorError(orchestrator=self, error=exc))
             raise
         finally:
             # Signal the end of orchestration
-            self.handle_event(
-                controlflow.events.orchestrator_events.OrchestratorEnd(
-                    orchestrator=self
-                )
-            )
+            self.handle_event(OrchestratorEnd(orchestrator=self))
         return run_context
 
     @prefect_task
@@ -257,7 +256,15 @@ class Orchestrator(ControlFlowModel):
             Union[RunEndCondition, Callable[[RunContext], bool]]
         ] = None,
     ) -> RunContext:
-        import controlflow.events.orchestrator_events
+        # deferred import to avoid a circular dependency; bind the event
+        # classes once so the loop doesn't repeat the attribute lookups
+        from controlflow.events.orchestrator_events import (
+            AgentTurnEnd,
+            AgentTurnStart,
+            OrchestratorEnd,
+            OrchestratorError,
+            OrchestratorStart,
+        )
 
         # Create the base termination condition
         if run_until is None:
@@ -284,9 +291,7 @@ class Orchestrator(ControlFlowModel):
             )
 
         # Signal the start of orchestration
-        await self.handle_event_async(
-            controlflow.events.orchestrator_events.OrchestratorStart(orchestrator=self)
-        )
+        await self.handle_event_async(OrchestratorStart(orchestrator=self))
 
         try:
             while True:
@@ -294,18 +299,14 @@ class Orchestrator(ControlFlowModel):
                     break
 
                 await self.handle_event_async(
-                    controlflow.events.orchestrator_events.AgentTurnStart(
-                        orchestrator=self, agent=self.agent
-                    )
+                    AgentTurnStart(orchestrator=self, agent=self.agent)
                 )
                 await self.run_agent_turn_async(
                     run_context=run_context,
                     model_kwargs=model_kwargs,
                 )
                 await self.handle_event_async(
-                    controlflow.events.orchestrator_events.AgentTurnEnd(
-                        orchestrator=self, agent=self.agent
-                    )
+                    AgentTurnEnd(orchestrator=self, agent=self.agent)
                 )
 
                 # Select the next agent for the following turn
@@ -317,18 +318,12 @@ class Orchestrator(ControlFlowModel):
         except Exception as exc:
             # Handle any exceptions that occur during orchestration
             await self.handle_event_async(
-                controlflow.events.orchestrator_events.OrchestratorError(
-                    orchestrator=self, error=exc
-                )
+                OrchestratorError(orchestrator=self, error=exc)
             )
             raise
         finally:
             # Signal the end of orchestration
-            await self.handle_event_async(
-                controlflow.events.orchestrator_events.OrchestratorEnd(
-                    orchestrator=self
-                )
-            )
+            await self.handle_event_async(OrchestratorEnd(orchestrator=self))
         return run_context
 
     @prefect_task(task_run_name="Agent turn: {self.agent.name}")
@@ -355,10 +350,13 @@ class Orchestrator(ControlFlowModel):
                     )
                 )
 
+        # only tasks with an LLM call budget need the per-call limit check
+        limited_tasks = [t for t in assigned_tasks if t.max_llm_calls]
+
         while not self.turn_strategy.should_end_turn():
             # fail any tasks that have reached their max llm calls
-            for task in assigned_tasks:
-                if task.max_llm_calls and task._llm_calls >= task.max_llm_calls:
+            for task in limited_tasks:
+                if task._llm_calls >= task.max_llm_calls:
                     task.mark_failed(reason="Max LLM calls reached for this task.")
 
             # Check if there are any ready tasks left
@@ -369,8 +367,8 @@ class Orchestrator(ControlFlowModel):
             if run_context.should_end():
                 break
 
-            messages = self.compile_messages()
             tools = self.get_tools()
+            messages = self.compile_messages(tools=tools)
 
             for event in self.agent._run_model(
                 messages=messages,
@@ -415,10 +413,13 @@ class Orchestrator(ControlFlowModel):
                     )
                 )
 
+        # only tasks with an LLM call budget need the per-call limit check
+        limited_tasks = [t for t in assigned_tasks if t.max_llm_calls]
+
         while not self.turn_strategy.should_end_turn():
             # fail any tasks that have reached their max llm calls
-            for task in assigned_tasks:
-                if task.max_llm_calls and task._llm_calls >= task.max_llm_calls:
+            for task in limited_tasks:
+                if task._llm_calls >= task.max_llm_calls:
                     task.mark_failed(reason="Max LLM calls reached for this task.")
 
             # Check if there are any ready tasks left
@@ -429,8 +430,8 @@ class Orchestrator(ControlFlowModel):
             if run_context.should_end():
                 break
 
-            messages = self.compile_messages()
             tools = self.get_tools()
+            messages = self.compile_messages(tools=tools)
 
             async for event in self.agent._run_model_async(
                 messages=messages,
@@ -445,10 +446,14 @@ class Orchestrator(ControlFlowModel):
 
         run_context.agent_turns += 1
 
-    def compile_prompt(self) -> str:
+    def compile_prompt(self, tools: Optional[list[Tool]] = None) -> str:
         """
         Compile the prompt for the current turn.
 
+        Args:
+            tools (Optional[list[Tool]]): The tools available for the current
+                turn. If not provided, they are collected via `get_tools()`.
+
         Returns:
             str: The compiled prompt.
         """
@@ -462,12 +467,20 @@ class Orchestrator(ControlFlowModel):
 
         llm_rules = self.agent.get_llm_rules()
 
+        if tools is None:
+            tools = self.get_tools()
+
+        # collect ready tasks once and derive the assigned subset from them,
+        # rather than re-walking the task graph for each template
+        ready_tasks = self.get_tasks("ready")
+        assigned_tasks = [t for t in ready_tasks if self.agent in t.get_agents()]
+
         prompts = [
             self.agent.get_prompt(),
             self.flow.get_prompt(),
-            TasksTemplate(tasks=self.get_tasks("ready")).render(),
-            ToolTemplate(tools=self.get_tools()).render(),
-            MemoryTemplate(memories=self.get_memories()).render(),
+            TasksTemplate(tasks=ready_tasks).render(),
+            ToolTemplate(tools=tools).render(),
+            MemoryTemplate(memories=self.get_memories(tasks=assigned_tasks)).render(),
             InstructionsTemplate(instructions=get_instructions()).render(),
             LLMInstructionsTemplate(
                 instructions=llm_rules.model_instructions()
@@ -478,10 +491,14 @@ class Orchestrator(ControlFlowModel):
         logger.debug(f"{'='*10}\nCompiled prompt: {prompt}\n{'='*10}")
         return prompt
 
-    def compile_messages(self) -> list[BaseMessage]:
+    def compile_messages(self, tools: Optional[list[Tool]] = None) -> list[BaseMessage]:
         """
         Compile messages for the current turn.
 
+        Args:
+            tools (Optional[list[Tool]]): The tools available for the current
+                turn. If not provided, they are collected via `get_tools()`.
+
         Returns:
             list[BaseMessage]: The compiled messages.
         """
@@ -490,7 +507,7 @@ class Orchestrator(ControlFlowModel):
         compiler = MessageCompiler(
             events=events,
             llm_rules=self.agent.get_llm_rules(),
-            system_prompt=self.compile_prompt(),
+            system_prompt=self.compile_prompt(tools=tools),
         )
         messages = compiler.compile_to_messages(agent=self.agent)
         return messages
@@ -115,6 +115,9 @@ ROLE_COLORS = {
     "ai": "blue",
     "user": "green",
 }
+# reuse a single spinner for all running tool calls; every live refresh
+# re-renders every tool row, so per-call Spinner allocations add up
+RUNNING_SPINNER = Spinner("dots")
 ROLE_NAMES = {
     "system": "System",
     "ai": "Agent",
@@ -194,10 +197,10 @@ def format_event(
 def format_tool_call(tool_call: ToolCall) -> Panel:
     if controlflow.settings.tools_verbose:
         return status(
-            Spinner("dots"),
+            RUNNING_SPINNER,
             f'Tool call: "{tool_call["name"]}"\n\nTool args: {tool_call["args"]}',
         )
-    return status(Spinner("dots"), f'Tool call: "{tool_call["name"]}"')
+    return status(RUNNING_SPINNER, f'Tool call: "{tool_call["name"]}"')
 
 
 def format_tool_result(event: ToolResultEvent) -> Panel:
@@ -8,7 +8,7 @@ from controlflow.memory.memory import Memory
 from controlflow.tasks.task import Task
 from controlflow.tools.tools import Tool
 from controlflow.utilities.general import ControlFlowModel
-from controlflow.utilities.jinja import prompt_env
+from controlflow.utilities.jinja import compile_template, prompt_env
 
 
 class Template(ControlFlowModel):
@@ -31,7 +31,7 @@ class Template(ControlFlowModel):
         del render_kwargs["template_path"]
 
         if self.template is not None:
-            template = prompt_env.from_string(self.template)
+            template = compile_template(self.template)
         else:
             template = prompt_env.get_template(self.template_path)
         return template.render(**render_kwargs | kwargs)
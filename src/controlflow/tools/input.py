@@ -1,3 +1,5 @@
+import asyncio
+
 from rich.prompt import Prompt as RichPrompt
 
 from controlflow.tools import tool
@@ -31,14 +33,17 @@ class Prompt(RichPrompt):
 
 
 @tool(instructions=INSTRUCTIONS, include_return_description=False)
-def cli_input(message: str, wait_for_response: bool = True) -> str:
+async def cli_input(message: str, wait_for_response: bool = True) -> str:
     """
     Send a message to a human user and optionally wait for a response from the CLI
     """
 
     if wait_for_response:
-        result = RichPrompt.ask(
-            f"\n[bold blue]🤖 Agent:[/] [blue]{message}[/]\nType your response"
+        # the prompt blocks on stdin, so run it in a thread to avoid freezing
+        # the event loop (and everything driven by it) while waiting
+        result = await asyncio.to_thread(
+            RichPrompt.ask,
+            f"\n[bold blue]🤖 Agent:[/] [blue]{message}[/]\nType your response",
         )
         return f"User response: {result}"
 
@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import inspect
 import json
@@ -7,6 +8,7 @@ from typing import Annotated, Any, Callable, Optional, Union
 import langchain_core.tools
 import pydantic
 from langchain_core.messages import InvalidToolCall, ToolCall
+from prefect.context import FlowRunContext
 from prefect.utilities.asyncutils import run_coro_as_sync
 from pydantic import Field, PydanticSchemaGenerationError, TypeAdapter
 
@@ -51,19 +53,32 @@ class Tool(ControlFlowModel):
 
     fn: Callable = Field(None, exclude=True)
     _lc_tool: Optional[langchain_core.tools.BaseTool] = None
+    _fn_signature: Optional[inspect.Signature] = None
 
     def to_lc_tool(self) -> dict:
         payload = self.model_dump(include={"name", "description", "parameters"})
         return payload
 
+    def _bind_args(self, input: dict) -> dict:
+        # inspect.signature is relatively expensive, so compute it once per tool
+        if self._fn_signature is None:
+            self._fn_signature = inspect.signature(self.fn)
+        return self._fn_signature.bind(**input).arguments
+
     @prefect_task(task_run_name="Tool call: {self.name}")
     def run(self, input: dict):
         result = self.fn(**input)
         if inspect.isawaitable(result):
             result = run_coro_as_sync(result)
 
+        # tool calls always run as Prefect tasks, so a task run context is
+        # guaranteed; only skip the artifact when there's no enclosing flow
+        # run for it to show up under
+        if not FlowRunContext.get():
+            return result
+
         # prepare artifact
-        passed_args = inspect.signature(self.fn).bind(**input).arguments
+        passed_args = self._bind_args(input)
         try:
             # try to pretty print the args
             passed_args = json.dumps(passed_args, indent=2)
@@ -86,14 +101,23 @@ class Tool(ControlFlowModel):
         if inspect.isawaitable(result):
             result = await result
 
+        # tool calls always run as Prefect tasks, so a task run context is
+        # guaranteed; only skip the artifact when there's no enclosing flow
+        # run for it to show up under
+        if not FlowRunContext.get():
+            return result
+
         # prepare artifact
-        passed_args = inspect.signature(self.fn).bind(**input).arguments
+        passed_args = self._bind_args(input)
         try:
             # try to pretty print the args
             passed_args = json.dumps(passed_args, indent=2)
         except Exception:
             pass
-        create_markdown_artifact(
+        # the artifact is created with a sync client, so run it in a thread to
+        # avoid blocking the event loop
+        await asyncio.to_thread(
+            create_markdown_artifact,
             markdown=TOOL_CALL_FUNCTION_RESULT_TEMPLATE.format(
                 name=self.name,
                 description=self.description or "(none provided)",
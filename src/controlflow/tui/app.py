@@ -34,7 +34,14 @@ class TUIApp(App):
     def __init__(self, flow: "controlflow.Flow", **kwargs):
         self._flow = flow
         self._tasks = flow.tasks
-        self._is_ready = False
+        # map task / message ids to widgets so streaming updates don't have to
+        # search the widget tree with query_one
+        self._task_widgets: dict[str, TUITask] = {}
+        self._message_widgets: dict[str, Union[TUIMessage, TUIToolMessage]] = {}
+        self._ready_event = asyncio.Event()
+        # set whenever the app is not holding, so waiters can proceed
+        self._hold_event = asyncio.Event()
+        self._hold_event.set()
         super().__init__(**kwargs)
 
     @asynccontextmanager
@@ -58,8 +65,7 @@ class TUIApp(App):
                 )
             )
 
-            while not self._is_ready:
-                await asyncio.sleep(0.01)
+            await self._ready_event.wait()
 
             if hold is not None:
                 self.hold = hold
@@ -71,19 +77,22 @@ class TUIApp(App):
             raise
         finally:
             if run:
-                while self.hold:
-                    await asyncio.sleep(0.01)
+                await self._hold_event.wait()
                 self.exit()
 
     def exit(self, *args, **kwargs):
         self.hold = False
-        self._is_ready = False
+        self._ready_event.clear()
         return super().exit(*args, **kwargs)
 
     def action_toggle_hold(self):
         self.hold = not self.hold
 
     def watch_hold(self, hold: bool):
+        if hold:
+            self._hold_event.clear()
+        else:
+            self._hold_event.set()
         try:
             if hold:
                 self.query_one("#hold-banner").display = "block"
@@ -98,7 +107,7 @@ class TUIApp(App):
         else:
             self.title = "ControlFlow"
         # self.sub_title = "With title and sub-title"
-        self._is_ready = True
+        self._ready_event.set()
 
     # ---------------------------
     #
@@ -107,34 +116,34 @@ class TUIApp(App):
     # ---------------------------
 
     def update_task(self, task: "controlflow.Task"):
-        try:
-            component = self.query_one(f"#task-{task.id}", TUITask)
+        component = self._task_widgets.get(task.id)
+        if component is not None:
             component.task = task
-            component.scroll_visible()
-        except NoMatches:
-            new_task = TUITask(task=task, id=f"task-{task.id}")
-            self.query_one("#tasks-container", Column).mount(new_task)
-            new_task.scroll_visible()
+        else:
+            component = TUITask(task=task, id=f"task-{task.id}")
+            self._task_widgets[task.id] = component
+            self.query_one("#tasks-container", Column).mount(component)
+        component.scroll_visible()
 
     def update_message(self, message: Union[UserMessage, AIMessage]):
-        try:
-            component = self.query_one(f"#message-{message.id}", TUIMessage)
+        component = self._message_widgets.get(message.id)
+        if component is not None:
             component.message = message
-            component.scroll_visible()
-        except NoMatches:
-            new_message = TUIMessage(message=message, id=f"message-{message.id}")
-            self.query_one("#thread-container", Column).mount(new_message)
-            new_message.scroll_visible()
+        else:
+            component = TUIMessage(message=message, id=f"message-{message.id}")
+            self._message_widgets[message.id] = component
+            self.query_one("#thread-container", Column).mount(component)
+        component.scroll_visible()
 
     def update_tool_result(self, message: ToolMessage):
-        try:
-            component = self.query_one(f"#message-{message.id}", TUIToolMessage)
+        component = self._message_widgets.get(message.id)
+        if component is not None:
             component.message = message
-            component.scroll_visible()
-        except NoMatches:
-            new_step = TUIToolMessage(message=message, id=f"message-{message.id}")
-            self.query_one("#thread-container", Column).mount(new_step)
-            new_step.scroll_visible()
+        else:
+            component = TUIToolMessage(message=message, id=f"message-{message.id}")
+            self._message_widgets[message.id] = component
+            self.query_one("#thread-container", Column).mount(component)
+        component.scroll_visible()
 
     def set_agent(self, agent: "controlflow.Agent"):
         self.agent = agent
@@ -151,7 +160,9 @@ class TUIApp(App):
                     yield Label("Tasks", id="tasks-title", classes="title")
                     with Column(id="tasks-container"):
                         for task in self._tasks.values():
-                            yield TUITask(task=task, id=f"task-{task.id}")
+                            tui_task = TUITask(task=task, id=f"task-{task.id}")
+                            self._task_widgets[task.id] = tui_task
+                            yield tui_task
                 yield Column(id="separator")
                 with Column(id="thread"):
                     yield Label("Thread", id="thread-title", classes="title")
@@ -1,10 +1,12 @@
 import inspect
 import os
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from jinja2 import Environment as JinjaEnvironment
 from jinja2 import PackageLoader, StrictUndefined, select_autoescape
+from jinja2 import Template as JinjaTemplate
 
 global_fns = {
     "now": lambda: datetime.now(ZoneInfo("UTC")),
@@ -18,8 +20,20 @@ prompt_env = JinjaEnvironment(
     autoescape=select_autoescape(default_for_string=False),
     trim_blocks=True,
     lstrip_blocks=True,
-    auto_reload=True,
+    # the templates ship with the package and never change at runtime, so
+    # compiled templates can be cached without freshness checks
+    auto_reload=False,
     undefined=StrictUndefined,
 )
 
 prompt_env.globals.update(global_fns)
+
+
+@lru_cache(maxsize=1000)
+def compile_template(source: str) -> JinjaTemplate:
+    """
+    Compile a template string with the prompt environment, caching the compiled
+    template so that repeated renders of the same source skip Jinja's
+    lex/parse/compile step.
+    """
+    return prompt_env.from_string(source)
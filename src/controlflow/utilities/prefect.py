@@ -1,4 +1,5 @@
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import (
     Any,
 )
@@ -76,6 +77,14 @@ def create_markdown_artifact(
     )
 
 
+@lru_cache(maxsize=None)
+def _get_type_adapter(data_type: type) -> TypeAdapter:
+    """
+    Building a TypeAdapter is expensive, so cache one per type.
+    """
+    return TypeAdapter(data_type)
+
+
 def create_json_artifact(
     key: str,
     data: Any,
@@ -88,7 +97,7 @@ def create_json_artifact(
     """
 
     try:
-        markdown = TypeAdapter(type(data)).dump_json(data, indent=2).decode()
+        markdown = _get_type_adapter(type(data)).dump_json(data, indent=2).decode()
         markdown = f"```json\n{markdown}\n```"
     except Exception:
         markdown = str(data)
@@ -126,6 +126,28 @@ class TestAgentPrompt:
         prompt = agent.get_prompt()
         assert prompt == "abc"
 
+    def test_default_prompt_is_cached(self):
+        agent = Agent(name="abc")
+        assert agent.get_prompt() is agent.get_prompt()
+
+    def test_default_prompt_cache_invalidated_on_field_change(self):
+        agent = Agent(name="abc")
+        prompt = agent.get_prompt()
+        assert "pirate" not in prompt
+
+        agent.instructions = "Talk like a pirate"
+        new_prompt = agent.get_prompt()
+        assert new_prompt is not prompt
+        assert "Talk like a pirate" in new_prompt
+
+        agent.name = "xyz"
+        assert "xyz" in agent.get_prompt()
+
+    def test_custom_prompt_is_not_cached(self):
+        agent = Agent(name="abc", prompt="{{ agent.name }}")
+        agent.get_prompt()
+        assert agent._prompt_cache is None
+
 
 class TestAgentSerialization:
     def test_serialize_for_prompt(self):
@@ -216,3 +238,14 @@ class TestLLMRules:
         rules = LLMRules(model=None)
         agent = Agent(llm_rules=rules, model=ChatOpenAI(model="gpt-4o-mini"))
         assert agent.get_llm_rules() is rules
+
+    def test_llm_rules_are_cached(self):
+        agent = Agent(model=ChatOpenAI(model="gpt-4o-mini"))
+        assert agent.get_llm_rules() is agent.get_llm_rules()
+
+    def test_llm_rules_recomputed_when_model_changes(self):
+        agent = Agent(model=ChatOpenAI(model="gpt-4o-mini"))
+        assert isinstance(agent.get_llm_rules(), OpenAIRules)
+
+        agent.model = ChatAnthropic(model="claude-3-haiku-20240307")
+        assert isinstance(agent.get_llm_rules(), AnthropicRules)
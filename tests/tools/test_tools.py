@@ -243,6 +243,40 @@ class TestRunTools:
             foo.run({})
 
 
+class TestToolArtifacts:
+    @pytest.fixture
+    def artifacts(self, monkeypatch):
+        created = []
+        monkeypatch.setattr(
+            "controlflow.tools.tools.create_markdown_artifact",
+            lambda **kwargs: created.append(kwargs),
+        )
+        return created
+
+    def test_no_artifact_outside_flow_run(self, artifacts):
+        @tool
+        def foo():
+            return 2
+
+        assert foo.run({}) == 2
+        assert artifacts == []
+
+    def test_artifact_created_inside_flow_run(self, artifacts):
+        import prefect
+
+        @tool
+        def foo():
+            return 2
+
+        @prefect.flow
+        def run_foo():
+            return foo.run({})
+
+        assert run_foo() == 2
+        assert len(artifacts) == 1
+        assert artifacts[0]["key"] == "tool-result"
+
+
 class TestHandleTools:
     def handle_tool_call(self):
         @tool
@@ -0,0 +1,15 @@
+from controlflow.utilities.jinja import compile_template
+
+
+class TestCompileTemplate:
+    def test_render(self):
+        template = compile_template("Hello, {{ name }}!")
+        assert template.render(name="world") == "Hello, world!"
+
+    def test_identical_sources_reuse_compiled_template(self):
+        assert compile_template("{{ a }}-{{ b }}") is compile_template(
+            "{{ a }}-{{ b }}"
+        )
+
+    def test_different_sources_compile_separately(self):
+        assert compile_template("{{ a }}") is not compile_template("{{ b }}")